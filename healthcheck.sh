@@ -6,6 +6,15 @@ echo "KUBERNETES HOMELAB HEALTH CHECK"
 echo "========================================="
 echo ""
 
+# Ceph exec is the slowest call and independent of the rest; start it now
+CEPH_OUT=$(mktemp)
+kubectl -n rook-ceph exec deploy/rook-ceph-tools -- ceph status >"$CEPH_OUT" 2>/dev/null &
+CEPH_PID=$!
+trap 'rm -f "$CEPH_OUT"; kill "$CEPH_PID" 2>/dev/null' EXIT
+
+# Pod list is read by several sections; fetch it once per run
+ALL_PODS=$(kubectl get pods -A)
+
 # 1. NODE HEALTH
 echo "1. NODE STATUS"
 echo "----------------------------------------"
@@ -15,25 +24,26 @@ echo ""
 # 2. ALL PODS (looking for anything not Running/Completed)
 echo "2. PROBLEMATIC PODS (Not Running/Completed)"
 echo "----------------------------------------"
-kubectl get pods -A | grep -v "Running\|Completed" | head -20
+[ -n "$ALL_PODS" ] && echo "$ALL_PODS" | grep -v "Running\|Completed" | head -20
 echo ""
 
 # 3. PODS NOT READY (e.g., 1/2 instead of 2/2)
 echo "3. PODS NOT FULLY READY"
 echo "----------------------------------------"
-kubectl get pods -A | awk '$3 !~ /([0-9]+)\/\1/' | grep -v RESTARTS
+[ -n "$ALL_PODS" ] && echo "$ALL_PODS" | awk '$3 !~ /([0-9]+)\/\1/' | grep -v RESTARTS
 echo ""
 
 # 4. ARGOCD APPLICATION STATUS
 echo "4. ARGOCD APPLICATIONS"
 echo "----------------------------------------"
-kubectl get applications -n argocd -o custom-columns=NAME:.metadata.name,SYNC:.status.sync.status,HEALTH:.status.health.status
+ARGO_APPS=$(kubectl get applications -n argocd -o custom-columns=NAME:.metadata.name,SYNC:.status.sync.status,HEALTH:.status.health.status)
+[ -n "$ARGO_APPS" ] && echo "$ARGO_APPS"
 echo ""
 
 # 5. CHECK SPECIFICALLY FOR DEGRADED/OUTOFSYNC
 echo "5. APPLICATIONS NEEDING ATTENTION"
 echo "----------------------------------------"
-kubectl get applications -n argocd -o json | jq -r '.items[] | select(.status.sync.status != "Synced" or .status.health.status != "Healthy") | "\(.metadata.name): Sync=\(.status.sync.status) Health=\(.status.health.status)"'
+[ -n "$ARGO_APPS" ] && echo "$ARGO_APPS" | awk 'NR > 1 && ($2 != "Synced" || $3 != "Healthy") { print $1 ": Sync=" $2 " Health=" $3 }'
 echo ""
 
 # 6. DEPLOYMENTS NOT AVAILABLE
@@ -69,7 +79,13 @@ echo ""
 # 11. CEPH HEALTH
 echo "11. CEPH CLUSTER HEALTH"
 echo "----------------------------------------"
-kubectl -n rook-ceph exec -it deploy/rook-ceph-tools -- ceph status 2>/dev/null || echo "Ceph tools not available"
+if wait "$CEPH_PID"; then
+    cat "$CEPH_OUT"
+else
+    echo "Ceph tools not available"
+fi
+rm -f "$CEPH_OUT"
+trap - EXIT
 echo ""
 
 # 12. SERVICE CONNECTIVITY